@@ -5,10 +5,11 @@ Zapewnia klasy do zarządzania zadaniami w CLI:
 - Zadanie: bazowa klasa zadania z możliwością dodatkowych atrybutów.
 - ZadaniePiorytetowe: zadanie z priorytetem.
 - ZadanieRegularne: zadanie powtarzalne.
-- ManagerZadan: Wprowadzanie, odczytanie, sortowanie, zmiana statusu Zadania oraz zapis/odczyt zadań w pliku tekstowym.
+- ManagerZadan: Wprowadzanie, odczytanie, sortowanie, zmiana statusu Zadania oraz zapis/odczyt zadań w pliku tekstowym
+  lub binarnym (pickle).
 
 Dodatkowo:
-- dekorator @czas_wykonania mierzy czas wykonania operacji.
+- dekorator @czas_wykonania mierzy czas wykonania operacji (gdy ustawiono TASK_MANAGER_TIMING=1).
 - dokumentacja metod i klas zawarta w docstringach.
 
 Kod pobrany z: https://github.com/twoje-konto/twoje-repozytorium
@@ -21,25 +22,83 @@ Tworzenie środowiska wirtualnego:
     source venv/bin/activate
     pip install -r requirements.txt
 """
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache, wraps
+import heapq
 import os
+import pickle
 import time
 
+try:
+    import numpy as np  # opcjonalnie: szybsze wczytywanie terminów
+except ImportError:
+    np = None
+
+FORMAT_BIN_WERSJA = 1  # wersja formatu pliku binarnego
+_MAX_DATE = datetime.max.date()  # klucz sortowania dla zadań bez terminu
+_BUFOR = 1 << 20  # rozmiar bufora plików zapisu/odczytu (1 MiB)
+_DEFAULT_SAVE_DIR = os.path.dirname(os.path.abspath(__file__))  # katalog skryptu
+_WLACZONE = ("1", "true", "yes", "on")  # wartości włączające TASK_MANAGER_TIMING
+
 
 def czas_wykonania(func):
     """
     Dekorator mierzący czas wykonania funkcji.
+    Pomiar jest włączany zmienną środowiskową TASK_MANAGER_TIMING=1 (także
+    true/yes/on, sprawdzaną przy imporcie modułu); w innym wypadku zwracana
+    jest niezmieniona funkcja.
     :param func: funkcja do opakowania
     :return: wynik funkcji
     """
+    if os.environ.get("TASK_MANAGER_TIMING", "").strip().lower() not in _WLACZONE:
+        return func
+
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         print(f"Funkcja '{func.__name__}' wykonana w {end - start:.4f} s")
         return result
     return wrapper
 
+def _ma_ksztalt_terminu(s):
+    """
+    Sprawdza, czy napis ma dokładnie postać YYYY-MM-DD (cyfry ASCII, rok od 0001).
+    :param s: napis z datą
+    :return: True, jeśli można go sparsować szybką ścieżką
+    """
+    return (len(s) == 10 and s[4] == "-" and s[7] == "-" and s.isascii()
+            and (s[0:4] + s[5:7] + s[8:10]).isdigit() and s[0:4] != "0000")
+
+@lru_cache(maxsize=4096)
+def _parsuj_termin(s):
+    """
+    Parsuje termin w formacie %Y-%m-%d. Dokładną postać YYYY-MM-DD parsuje
+    bez strptime; pozostałe napisy (np. "2025-5-1") przekazuje do strptime.
+    :param s: napis z datą
+    :return: obiekt date
+    :raises ValueError: gdy napis nie jest datą w formacie %Y-%m-%d
+    """
+    if _ma_ksztalt_terminu(s):
+        return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+@lru_cache(maxsize=64)
+def _bezpieczna_sciezka(save_dir, nazwa_pliku):
+    """
+    Zwraca pełną ścieżkę pliku, sprawdzając, że leży w katalogu zapisu.
+    :param save_dir: katalog zapisu/odczytu
+    :param nazwa_pliku: nazwa pliku
+    :return: pełna ścieżka
+    :raises ValueError: gdy ścieżka wychodzi poza save_dir
+    """
+    save_dir = os.path.normpath(save_dir)
+    full_path = os.path.normpath(os.path.join(save_dir, nazwa_pliku))
+    if os.path.commonpath([save_dir, full_path]) != save_dir:
+        raise ValueError("Ścieżka spoza katalogu skryptu niedozwolona")
+    return full_path
+
 class Zadanie:
     """
     Bazowa klasa zadania.
@@ -47,38 +106,54 @@ class Zadanie:
     :param tytul: tytuł zadania
     :param opis: opis zadania (domyślnie pusty)
     :param termin: termin realizacji (str YYYY-MM-DD lub date)
-    :param kwargs: dodatkowe atrybuty zadania
+    :param kwargs: dodatkowe atrybuty zadania (przechowywane w _extras)
     """
+    __slots__ = ('tytul', 'opis', 'termin_wykonaia', 'wykonane', '_extras')
+    _typename = "Zadanie"  # nazwa typu w pliku zapisu
+    _RESERVED = frozenset({'tytul', 'opis', 'termin_wykonaia', 'wykonane'})  # pola ustawiane wprost
+
     def __init__(self, tytul, opis="", termin=None, **kwargs):
         self.tytul = tytul
         self.opis = opis
         if isinstance(termin, str):
             try:
-                self.termin_wykonaia = datetime.strptime(termin, "%Y-%m-%d").date()
+                self.termin_wykonaia = _parsuj_termin(termin)
             except ValueError:
                 self.termin_wykonaia = None
         else:
             self.termin_wykonaia = termin
         self.wykonane = False
+        self._extras = {}
         for k, v in kwargs.items():
+            self._ustaw_atrybut(k, v)
+
+    def _ustaw_atrybut(self, k, v):
+        """
+        Ustawia atrybut zadania; nieznane nazwy trafiają do _extras.
+        :param k: nazwa atrybutu
+        :param v: wartość
+        """
+        if k in self._RESERVED:
             setattr(self, k, v)
+        else:
+            self._extras[k] = v
 
-    def __str__(self):
+    def _atrybuty(self):
         """
-        Zwraca reprezentację tekstową zadania, w tym wszystkie dodatkowe atrybuty.
-        :return: string z tytułem, opisem, terminem, statusem i dodatkowymi polami
-        """
-        base = [f"Tytuł: {self.tytul}", f"Opis: {self.opis}", f"Termin: {self.termin_wykonaia}"]
-        status = 'Wykonane' if self.wykonane else 'Niewykonane'
-        base.append(f"Wykonany: {status}")
-        # zbieramy dodatkowe atrybuty
-        extras = []
-        for k, v in self.__dict__.items():
-            if k not in ('tytul','opis','termin_wykonaia','wykonane'):
-                extras.append(f"{k}={v}")
-        if extras:
-            base.append("Dodatkowe: " + ", ".join(extras))
-        return " | ".join(base)
+        Zwraca atrybuty zapisywane jako pary klucz=wartosc.
+        :return: słownik atrybutów
+        """
+        return dict(self._extras)
+
+    def _serialize(self):
+        """
+        Zwraca linię pliku zapisu (bez znaku nowej linii).
+        :return: pola rozdzielone średnikami
+        """
+        parts = [self._typename, self.tytul, self.opis, str(self.termin_wykonaia)]
+        parts += [k + "=" + str(v) for k, v in self._atrybuty().items()]
+        parts.append("wykonane=" + str(self.wykonane))
+        return ";".join(parts)
 
     def wykonany(self):
         """
@@ -93,25 +168,17 @@ class ZadaniePiorytetowe(Zadanie):
 
     :param priorytet: poziom priorytetu (domyślnie 'Średni')
     """
+    __slots__ = ('priorytet',)
+    _typename = "ZadaniePiorytetowe"
+    _RESERVED = Zadanie._RESERVED | {'priorytet'}
+
     def __init__(self, tytul, opis="", termin=None, priorytet="Średni", **kwargs):
         super().__init__(tytul, opis, termin, **kwargs)
         self.priorytet = priorytet
 
-    def __str__(self):
-        """
-        Zwraca reprezentację zadania priorytetowego, w tym wszystkie dodatkowe atrybuty.
-        """
-        base = [f"Tytuł: {self.tytul}", f"Opis: {self.opis}", f"Termin: {self.termin_wykonaia}",
-                f"Priorytet: {self.priorytet}"]
-        status = 'Wykonane' if self.wykonane else 'Niewykonane'
-        base.append(f"Wykonany: {status}")
-        extras = []
-        for k, v in self.__dict__.items():
-            if k not in ('tytul', 'opis', 'termin_wykonaia', 'wykonane', 'priorytet'):
-                extras.append(f"{k}={v}")
-        if extras:
-            base.append("Dodatkowe: " + ", ".join(extras))
-        return " | ".join(base)
+    def _atrybuty(self):
+        """Zwraca atrybuty zapisywane jako pary klucz=wartosc, z priorytetem."""
+        return {**super()._atrybuty(), "priorytet": self.priorytet}
 
 class ZadanieRegularne(Zadanie):
     """
@@ -119,25 +186,109 @@ class ZadanieRegularne(Zadanie):
 
     :param powtarzalnosc: interwał powtarzania (domyślnie 'codziennie')
     """
+    __slots__ = ('powtarzalnosc',)
+    _typename = "ZadanieRegularne"
+    _RESERVED = Zadanie._RESERVED | {'powtarzalnosc'}
+
     def __init__(self, tytul, opis="", termin=None, powtarzalnosc="codziennie", **kwargs):
         super().__init__(tytul, opis, termin, **kwargs)
         self.powtarzalnosc = powtarzalnosc
 
-    def __str__(self):
-        """
-        Zwraca reprezentację zadania regularnego, w tym wszystkie dodatkowe atrybuty.
+    def _atrybuty(self):
+        """Zwraca atrybuty zapisywane jako pary klucz=wartosc, z powtarzalnością."""
+        return {**super()._atrybuty(), "powtarzalnosc": self.powtarzalnosc}
+
+def _generuj_str(cls, pola):
+    """
+    Generuje (exec) metodę __str__ klasy zadania jako jedno f-stringowe wyrażenie
+    po stałej liście pól, z dopisaniem statusu i dodatkowych atrybutów.
+    :param cls: klasa zadania
+    :param pola: pary (etykieta, nazwa atrybutu) w kolejności wyświetlania
+    """
+    body = " | ".join(f"{etykieta}: {{self.{attr}}}" for etykieta, attr in pola)
+    src = (
+        "def __str__(self):\n"
+        f"    s = f'{body} | Wykonany: {{\"Wykonane\" if self.wykonane else \"Niewykonane\"}}'\n"
+        "    if self._extras:\n"
+        "        s += ' | Dodatkowe: ' + ', '.join(f'{k}={v}' for k, v in self._extras.items())\n"
+        "    return s\n"
+    )
+    ns = {}
+    exec(src, ns)
+    fn = ns["__str__"]
+    fn.__qualname__ = f"{cls.__name__}.__str__"
+    fn.__doc__ = """
+        Zwraca reprezentację tekstową zadania, w tym wszystkie dodatkowe atrybuty.
+        :return: string z polami zadania, statusem i dodatkowymi polami
         """
-        base = [f"Tytuł: {self.tytul}", f"Opis: {self.opis}", f"Termin: {self.termin_wykonaia}",
-                f"Powtarzalność: {self.powtarzalnosc}"]
-        status = 'Wykonane' if self.wykonane else 'Niewykonane'
-        base.append(f"Wykonany: {status}")
-        extras = []
-        for k, v in self.__dict__.items():
-            if k not in ('tytul','opis','termin_wykonaia','wykonane','powtarzalnosc'):
-                extras.append(f"{k}={v}")
-        if extras:
-            base.append("Dodatkowe: " + ", ".join(extras))
-        return " | ".join(base)
+    cls.__str__ = fn
+
+_POLA_BAZOWE = (("Tytuł", "tytul"), ("Opis", "opis"), ("Termin", "termin_wykonaia"))
+_generuj_str(Zadanie, _POLA_BAZOWE)
+_generuj_str(ZadaniePiorytetowe, _POLA_BAZOWE + (("Priorytet", "priorytet"),))
+_generuj_str(ZadanieRegularne, _POLA_BAZOWE + (("Powtarzalność", "powtarzalnosc"),))
+
+_KLASY = {"ZadaniePiorytetowe": ZadaniePiorytetowe, "ZadanieRegularne": ZadanieRegularne}
+
+
+def _klucz_terminu(termin):
+    """
+    Zwraca klucz sortowania terminu: datetime sprowadzany do date, brak terminu na końcu.
+    :param termin: date, datetime lub None
+    :return: obiekt date
+    :raises TypeError: gdy termin nie jest datą
+    """
+    if termin is None:
+        return _MAX_DATE
+    if isinstance(termin, datetime):
+        return termin.date()
+    if isinstance(termin, date):
+        return termin
+    raise TypeError(f"Nieprawidłowy termin: {termin!r}")
+
+
+def _parsuj_terminy(terminy):
+    """
+    Parsuje listę terminów YYYY-MM-DD. Każdy różny napis jest parsowany raz;
+    z numpy unikalne napisy o dokładnej postaci YYYY-MM-DD idą jedną konwersją
+    datetime64 (numpy przyjąłby też np. "", "NaT" czy inne formaty ISO, więc
+    pozostałe obsługuje _parsuj_termin - wynik nie zależy od obecności numpy).
+    :param terminy: lista napisów z datami
+    :return: lista obiektów date
+    :raises ValueError: gdy któryś napis nie jest datą w formacie %Y-%m-%d
+    """
+    if np is None:
+        return [_parsuj_termin(t) for t in terminy]
+    mapa = {}
+    szybkie = []
+    for t in set(terminy):
+        if _ma_ksztalt_terminu(t):
+            szybkie.append(t)
+        else:
+            mapa[t] = _parsuj_termin(t)
+    if szybkie:
+        daty = np.array(szybkie, dtype="datetime64[D]").astype(object).tolist()
+        mapa.update(zip(szybkie, daty))
+    return [mapa[t] for t in terminy]
+
+
+def _utworz_zadanie(parts, date_val):
+    """
+    Tworzy zadanie z pól jednej linii pliku zapisu.
+    :param parts: pola linii typ;tytul;opis;termin;klucz=wartosc;...
+    :param date_val: sparsowany termin
+    :return: obiekt Zadanie (lub podklasy)
+    """
+    typ, tytul, opis = parts[0], parts[1], parts[2]
+    attrs = {}
+    for pair in parts[4:]:
+        k, _, v = pair.partition("=")
+        attrs[k] = (v == "True") if v in ("True", "False") else v
+    zad = _KLASY.get(typ, Zadanie)(tytul, opis, date_val, **attrs)
+    if attrs.get("wykonane"):
+        zad.wykonane = True
+    return zad
+
 
 class ManagerZadan:
     """
@@ -146,9 +297,74 @@ class ManagerZadan:
     :param save_dir: katalog zapisu/odczytu (domyślnie katalog skryptu)
     """
     def __init__(self, save_dir=None):
-        base = save_dir or os.path.dirname(os.path.abspath(__file__))
-        self.save_dir = base
+        self.save_dir = save_dir or _DEFAULT_SAVE_DIR
         self.zadania = []
+        self._by_title = {}  # indeks tytuł -> lista zadań
+        self._heap = []  # kopiec (termin, kolejnosc, uid, zadanie)
+        self._seq = 0  # licznik kolejności wstawienia i uid wpisów
+        self._wpisy = {}  # id(zadanie) -> lista [kolejnosc, uid], po jednej na wystąpienie w liście
+        self._stale = set()  # uid wpisów nieaktualnych
+
+    def _push(self, zadanie, kolejnosc):
+        """
+        Wkłada wpis zadania do kopca.
+        :param kolejnosc: pozycja zadania przy równych terminach
+        :return: [kolejnosc, uid] nowego wpisu
+        """
+        uid = self._seq
+        self._seq += 1
+        heapq.heappush(self._heap, (_klucz_terminu(zadanie.termin_wykonaia), kolejnosc, uid, zadanie))
+        return [kolejnosc, uid]
+
+    def _wstaw_do_kopca(self, zadanie):
+        """Wstawia nowe wystąpienie zadania do kopca terminów."""
+        wpis = self._push(zadanie, self._seq)
+        self._wpisy.setdefault(id(zadanie), []).append(wpis)
+
+    def _uniewaznij_w_kopcu(self, zadanie):
+        """Oznacza wpis pierwszego wystąpienia zadania w kopcu jako nieaktualny."""
+        wpisy = self._wpisy.get(id(zadanie))
+        if wpisy:
+            self._stale.add(wpisy.pop(0)[1])
+            if not wpisy:
+                del self._wpisy[id(zadanie)]
+
+    def _przenies_w_kopcu(self, zadanie):
+        """Po zmianie terminu wstawia wpisy zadania ponownie, zachowując ich kolejność."""
+        for wpis in self._wpisy.get(id(zadanie), []):
+            nowy = self._push(zadanie, wpis[0])
+            self._stale.add(wpis[1])
+            wpis[:] = nowy
+
+    def _kolejnosc(self, zadanie):
+        """Zwraca pozycję pierwszego wystąpienia zadania na liście (do porównań)."""
+        return self._wpisy[id(zadanie)][0][0]
+
+    def _indeksuj(self, zadanie):
+        """
+        Dodaje zadanie do indeksu tytułów. Kubełek jest uporządkowany jak lista
+        zadań, więc pierwszy element to pierwsze zadanie o danym tytule.
+        """
+        bucket = self._by_title.setdefault(zadanie.tytul, [])
+        if zadanie in bucket:
+            return
+        kolejnosc = self._kolejnosc(zadanie)
+        i = len(bucket)
+        while i and self._kolejnosc(bucket[i - 1]) > kolejnosc:
+            i -= 1
+        bucket.insert(i, zadanie)
+
+    def _usun_z_indeksu(self, zadanie, tytul=None):
+        """
+        Usuwa zadanie z indeksu tytułów.
+        :param tytul: kubełek do przeszukania (domyślnie bieżący tytuł zadania)
+        """
+        tytul = zadanie.tytul if tytul is None else tytul
+        bucket = self._by_title.get(tytul)
+        if bucket and zadanie in bucket:
+            bucket.remove(zadanie)
+            if not bucket:
+                del self._by_title[tytul]
 
     @czas_wykonania
     def dodaj_zadanie(self, zadanie=None, tytul=None, opis=None, termin=None, typ='zwykle', **kwargs):
@@ -170,23 +386,49 @@ class ManagerZadan:
                 zad = Zadanie(tytul, opis or "", termin, **kwargs)
         else:
             zad = zadanie
+        # najpierw kopiec i indeks (mogą zgłosić błąd), dopiero potem lista
+        self._wstaw_do_kopca(zad)
+        self._indeksuj(zad)
         self.zadania.append(zad)
 
+    @czas_wykonania
+    def dodaj_zadania(self, zadania):
+        """
+        Dodaje wiele gotowych zadań naraz (jeden pomiar czasu dla całej partii).
+        :param zadania: iterowalny zbiór obiektów Zadanie
+        """
+        zadania = list(zadania)
+        for zad in zadania:
+            _klucz_terminu(zad.termin_wykonaia)  # walidacja całej partii przed zmianą stanu
+        for zad in zadania:
+            self._wstaw_do_kopca(zad)
+            self._indeksuj(zad)
+        self.zadania.extend(zadania)
+
     @czas_wykonania
     def usun_zadanie(self, zadanie=None, tytul=None):
         """
         Usuwa zadanie po obiekcie lub tytule.
         """
-        target = zadanie or next((z for z in self.zadania if z.tytul == tytul), None)
-        if target and target in self.zadania:
-            self.zadania.remove(target)
+        target = zadanie or self._by_title.get(tytul, [None])[0]
+        if target is None:
+            return
+        try:
+            self.zadania.remove(target)  # jedno przejście listy zamiast `in` + remove
+        except ValueError:
+            return
+        self._uniewaznij_w_kopcu(target)
+        self._usun_z_indeksu(target)
+        if id(target) in self._wpisy:
+            # zadanie nadal jest na liście (dodane wielokrotnie): nowa pozycja w kubełku
+            self._indeksuj(target)
 
     @czas_wykonania
     def oznacz_jako_wykonane(self, zadanie=None, tytul=None):
         """
         Oznacza zadanie jako wykonane.
         """
-        target = zadanie or next((z for z in self.zadania if z.tytul == tytul), None)
+        target = zadanie or self._by_title.get(tytul, [None])[0]
         if target:
             target.wykonane = True
 
@@ -197,6 +439,8 @@ class ManagerZadan:
         Dodatkowe parametry przez **kwargs.
         """
         if zadanie in self.zadania:
+            stary_tytul = zadanie.tytul
+            stary_termin = zadanie.termin_wykonaia
             if nowy_tytul:
                 zadanie.tytul = nowy_tytul
             if nowy_opis:
@@ -204,7 +448,13 @@ class ManagerZadan:
             if nowy_termin:
                 zadanie.termin_wykonaia = nowy_termin
             for k, v in kwargs.items():
-                setattr(zadanie, k, v)
+                zadanie._ustaw_atrybut(k, v)
+            # tytuł i termin mogły też zmienić się przez kwargs (tytul=..., termin_wykonaia=...)
+            if zadanie.tytul != stary_tytul:
+                self._usun_z_indeksu(zadanie, stary_tytul)
+                self._indeksuj(zadanie)
+            if zadanie.termin_wykonaia != stary_termin:
+                self._przenies_w_kopcu(zadanie)
 
     @czas_wykonania
     def zapisz_do_pliku(self, nazwa_pliku="zadania.txt", encoding="utf-8"):  # argumenty domyślne
@@ -213,17 +463,11 @@ class ManagerZadan:
         :param nazwa_pliku: nazwa pliku do zapisu
         :param encoding: kodowanie pliku
         """
-        full_path = os.path.join(self.save_dir, nazwa_pliku)
-        if os.path.commonpath([self.save_dir, full_path]) != self.save_dir:
-            raise ValueError("Ścieżka spoza katalogu skryptu niedozwolona")
-        with open(full_path, "w", encoding=encoding) as f:
-            for z in self.zadania:
-                typ = type(z).__name__
-                parts = [typ, z.tytul, z.opis, str(z.termin_wykonaia)]
-                extras = {k: v for k, v in z.__dict__.items() if k not in ("tytul","opis","termin_wykonaia","wykonane")}
-                parts += [f"{k}={v}" for k, v in extras.items()]
-                parts.append(f"wykonane={z.wykonane}")
-                f.write(";".join(parts) + "\n")
+        full_path = _bezpieczna_sciezka(self.save_dir, nazwa_pliku)
+        lines = [z._serialize() + "\n" for z in self.zadania]
+        # jeden zapis zamiast osobnego write() dla każdego zadania
+        with open(full_path, "w", encoding=encoding, buffering=_BUFOR) as f:
+            f.write("".join(lines))
 
     @czas_wykonania
     def wczytaj_z_pliku(self, nazwa_pliku="zadania.txt", encoding="utf-8"):  # argumenty domyślne
@@ -232,28 +476,55 @@ class ManagerZadan:
         :param nazwa_pliku: nazwa pliku do odczytu
         :param encoding: kodowanie pliku
         """
-        full_path = os.path.join(self.save_dir, nazwa_pliku)
-        if os.path.commonpath([self.save_dir, full_path]) != self.save_dir:
-            raise ValueError("Ścieżka spoza katalogu skryptu niedozwolona")
-        with open(full_path, "r", encoding=encoding) as f:
-            for line in f:
-                parts = line.strip().split(";")
-                typ, tytul, opis, termin_str = parts[0], parts[1], parts[2], parts[3]
-                attr_pairs = parts[4:]
-                attrs = {}
-                for pair in attr_pairs:
-                    k,v = pair.split("=",1)
-                    attrs[k] = (v == "True") if v in ("True","False") else v
-                date_val = datetime.strptime(termin_str, "%Y-%m-%d").date()
-                if typ == "ZadaniePiorytetowe":
-                    zad = ZadaniePiorytetowe(tytul, opis, date_val, **attrs)
-                elif typ == "ZadanieRegularne":
-                    zad = ZadanieRegularne(tytul, opis, date_val, **attrs)
-                else:
-                    zad = Zadanie(tytul, opis, date_val, **attrs)
-                if attrs.get("wykonane"):
-                    zad.wykonane = True
-                self.zadania.append(zad)
+        full_path = _bezpieczna_sciezka(self.save_dir, nazwa_pliku)
+        with open(full_path, "r", encoding=encoding, buffering=_BUFOR) as f:
+            # tylko "\n" (tryb tekstowy zamienia już "\r\n"); splitlines() dzieliłby też np. po "\x0c"
+            raw_lines = f.read().split("\n")
+        rows = [line.split(";") for line in raw_lines if line]
+        terminy = _parsuj_terminy([parts[3] for parts in rows])
+        loaded = [_utworz_zadanie(parts, d) for parts, d in zip(rows, terminy)]
+        self.dodaj_zadania(loaded)
+
+    @czas_wykonania
+    def zapisz_do_pliku_bin(self, nazwa_pliku="zadania.pkl"):
+        """
+        Zapisuje zadania do pliku binarnego (pickle, protokół 5) jednym zapisem.
+        :param nazwa_pliku: nazwa pliku do zapisu
+        """
+        full_path = _bezpieczna_sciezka(self.save_dir, nazwa_pliku)
+        with open(full_path, "wb", buffering=_BUFOR) as f:
+            pickle.dump((FORMAT_BIN_WERSJA, self.zadania), f, protocol=5)
+
+    @czas_wykonania
+    def wczytaj_z_pliku_bin(self, nazwa_pliku="zadania.pkl"):
+        """
+        Wczytuje zadania z pliku binarnego zapisanego przez zapisz_do_pliku_bin.
+        Uwaga: pickle wykonuje kod z pliku - wczytuj tylko własne pliki.
+        :param nazwa_pliku: nazwa pliku do odczytu
+        """
+        full_path = _bezpieczna_sciezka(self.save_dir, nazwa_pliku)
+        with open(full_path, "rb", buffering=_BUFOR) as f:
+            wersja, loaded = pickle.load(f)
+        if wersja != FORMAT_BIN_WERSJA:
+            raise ValueError(f"Nieobsługiwana wersja pliku: {wersja}")
+        self.dodaj_zadania(loaded)
+
+    def iter_by_termin(self):
+        """
+        Zwraca zadania posortowane po terminie wykonania (bez terminu na końcu).
+        Nieaktualne wpisy kopca są przy okazji usuwane.
+        :return: lista zadań
+        """
+        survivors = []
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[2] in self._stale:
+                self._stale.discard(entry[2])
+                continue
+            survivors.append(entry)
+        # lista zdjęta z kopca jest posortowana, więc jest też poprawnym kopcem
+        self._heap = survivors
+        return [entry[3] for entry in survivors]
 
     def __str__(self):
         """Zwraca listę zadań w formie tekstu."""
@@ -264,6 +535,117 @@ class ManagerZadan:
         return zadanie in self.zadania
 
 
+_MENU = (
+    "Menu:\n"
+    "1. Dodaj zadanie\n"
+    "2. Usuń zadanie\n"
+    "3. Ustaw zadanie jako wykonane\n"
+    "4. Edytuj zadanie\n"
+    "5. Wyświetl wszystkie zadania\n"
+    "6. Wyświetl zadania posortowane po terminie wykonania\n"
+    "7. Zapisz zadania do pliku txt\n"
+    "8. Wczytaj zadania z pliku txt\n"
+    "0. Wyjście"
+)
+
+
+def _menu_dodaj(manager):
+    """Opcja 1: dodawanie zadania, wczytywanie danych od użytkownika."""
+    tytul = input("Podaj tytuł: ")
+    opis = input("Podaj opis: ")
+    termin = input("Podaj termin wykonania [DD-MM-YYYY]: ")
+    try:
+        termin_date = datetime.strptime(termin, "%d-%m-%Y").date()
+    except ValueError:
+        print("Nieprawidłowy format terminu. Użyj DD-MM-YYYY.")
+        return
+    typ = input("p=priorytetowe, r=regularne: ")
+    if typ == 'p':
+        priorytet = input("Podaj priorytet: ")
+        zad = ZadaniePiorytetowe(tytul, opis, termin_date, priorytet)
+    elif typ == 'r':
+        powtarzalnosc = input("Podaj powtarzalność: ")
+        zad = ZadanieRegularne(tytul, opis, termin_date, powtarzalnosc)
+    else:
+        print("Nieprawidłowy typ.")
+        return
+    manager.dodaj_zadanie(zad)
+
+
+def _menu_usun(manager):
+    """Opcja 2: usuwanie zadania po tytule."""
+    tytul = input("Tytuł do usunięcia: ")
+    zad = manager._by_title.get(tytul, [None])[0]
+    if zad:
+        manager.usun_zadanie(zad)
+    else:
+        print("Nie znaleziono.")
+
+
+def _menu_wykonane(manager):
+    """Opcja 3: toggle stanu wykonania."""
+    tytul = input("Tytuł wykonanego zadania: ")
+    zad = manager._by_title.get(tytul, [None])[0]
+    if zad:
+        zad.wykonany()
+    else:
+        print("Nie znaleziono.")
+
+
+def _menu_edytuj(manager):
+    """Opcja 4: edycja zadania."""
+    tytul = input("Tytuł do edycji: ")
+    zad = manager._by_title.get(tytul, [None])[0]
+    if zad:
+        nowy = input("Nowy tytuł (ENTER aby pominąć): ")
+        nowo = input("Nowy opis (ENTER aby pominąć): ")
+        nyt = input("Nowy termin DD-MM-YYYY (ENTER aby pominąć): ")
+        nyt_date = None
+        if nyt:
+            try:
+                nyt_date = datetime.strptime(nyt, "%d-%m-%Y").date()
+            except ValueError:
+                print("Nieprawidłowy termin.")
+        manager.edytuj_zadanie(zad, nowy or None, nowo or None, nyt_date)
+    else:
+        print("Nie znaleziono.")
+
+
+def _menu_wyswietl(manager):
+    """Opcja 5: wyświetlanie wszystkich zadań."""
+    print(manager)
+
+
+def _menu_posortowane(manager):
+    """Opcja 6: zadania posortowane po terminie."""
+    for z in manager.iter_by_termin():
+        print(z)
+
+
+def _menu_zapisz(manager):
+    """Opcja 7: zapis do pliku."""
+    fn = input("Nazwa pliku: ")
+    manager.zapisz_do_pliku(fn)
+
+
+def _menu_wczytaj(manager):
+    """Opcja 8: wczytanie z pliku."""
+    fn = input("Nazwa pliku: ")
+    manager.wczytaj_z_pliku(fn)
+
+
+_HANDLERS = {
+    '1': _menu_dodaj,
+    '2': _menu_usun,
+    '3': _menu_wykonane,
+    '4': _menu_edytuj,
+    '5': _menu_wyswietl,
+    '6': _menu_posortowane,
+    '7': _menu_zapisz,
+    '8': _menu_wczytaj,
+}
+
+
 # --- Definicje klas Zadanie, ZadaniePiorytetowe, ZadanieRegularne, ManagerZadan (jak wyżej) ---
 
 # Dokładna treść klas została pominięta dla skrótu
@@ -299,99 +681,15 @@ if __name__ == "__main__":
     )
 
     while True:
-        print("Menu:")
-        print("1. Dodaj zadanie")
-        print("2. Usuń zadanie")
-        print("3. Ustaw zadanie jako wykonane")
-        print("4. Edytuj zadanie")
-        print("5. Wyświetl wszystkie zadania")
-        print("6. Wyświetl zadania posortowane po terminie wykonania")
-        print("7. Zapisz zadania do pliku txt")
-        print("8. Wczytaj zadania z pliku txt")
-        print("0. Wyjście")
+        print(_MENU)
 
         choice = input("Wybierz opcję: ")
 
-        if choice == '1':
-            # Dodawanie zadania: wczytywanie danych od użytkownika
-            tytul = input("Podaj tytuł: ")
-            opis = input("Podaj opis: ")
-            termin = input("Podaj termin wykonania [DD-MM-YYYY]: ")
-            try:
-                termin_date = datetime.strptime(termin, "%d-%m-%Y").date()
-            except ValueError:
-                print("Nieprawidłowy format terminu. Użyj DD-MM-YYYY.")
-                continue
-            typ = input("p=priorytetowe, r=regularne: ")
-            if typ == 'p':
-                priorytet = input("Podaj priorytet: ")
-                zad = ZadaniePiorytetowe(tytul, opis, termin_date, priorytet)
-            elif typ == 'r':
-                powtarzalnosc = input("Podaj powtarzalność: ")
-                zad = ZadanieRegularne(tytul, opis, termin_date, powtarzalnosc)
-            else:
-                print("Nieprawidłowy typ.")
-                continue
-            manager.dodaj_zadanie(zad)
-
-        elif choice == '2':
-            # Usuwanie zadania po tytule
-            tytul = input("Tytuł do usunięcia: ")
-            zad = next((z for z in manager.zadania if z.tytul == tytul), None)
-            if zad:
-                manager.usun_zadanie(zad)
-            else:
-                print("Nie znaleziono.")
-
-        elif choice == '3':
-            # Toggle stanu wykonania
-            tytul = input("Tytuł wykonanego zadania: ")
-            zad = next((z for z in manager.zadania if z.tytul == tytul), None)
-            if zad:
-                zad.wykonany()
-            else:
-                print("Nie znaleziono.")
-
-        elif choice == '4':
-            # Edycja zadania
-            tytul = input("Tytuł do edycji: ")
-            zad = next((z for z in manager.zadania if z.tytul == tytul), None)
-            if zad:
-                nowy = input("Nowy tytuł (ENTER aby pominąć): ")
-                nowo = input("Nowy opis (ENTER aby pominąć): ")
-                nyt = input("Nowy termin DD-MM-YYYY (ENTER aby pominąć): ")
-                nyt_date = None
-                if nyt:
-                    try:
-                        nyt_date = datetime.strptime(nyt, "%d-%m-%Y").date()
-                    except ValueError:
-                        print("Nieprawidłowy termin.")
-                manager.edytuj_zadanie(zad, nowy or None, nowo or None, nyt_date)
-            else:
-                print("Nie znaleziono.")
-
-        elif choice == '5':
-            # Wyświetlanie wszystkich zadań
-            print(manager)
-
-        elif choice == '6':
-            # Sortowanie zadań po terminie
-            for z in sorted(manager.zadania, key=lambda x: x.termin_wykonaia or datetime.max.date()):
-                print(z)
-
-        elif choice == '7':
-            # Zapis do pliku
-            fn = input("Nazwa pliku: ")
-            manager.zapisz_do_pliku(fn)
-
-        elif choice == '8':
-            # Wczytanie z pliku
-            fn = input("Nazwa pliku: ")
-            manager.wczytaj_z_pliku(fn)
-
-        elif choice == '0':
+        if choice == '0':
             # Zakończenie programu
             break
-        else:
+        handler = _HANDLERS.get(choice)
+        if handler is None:
             print("Nieprawidłowy wybór.")
-
+        else:
+            handler(manager)